@@ -1,14 +1,21 @@
+import csv
+import hashlib
+import os
 import re
+import sys
+import tempfile
 import time
+from collections import Counter
 from pathlib import Path
+from typing import NamedTuple
 
+import joblib
 import numpy as np
-import pandas as pd
 import streamlit as st
 from PIL import Image
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import topk_kernel
+from stop_words import ENGLISH_STOP_WORDS
 
 
 # =========================================================
@@ -89,14 +96,12 @@ LOGO_PATH = APP_DIR / "logo.png"  # optional
 
 QA_CSV = DATA_DIR / "kb_qa.csv"
 CHUNKS_CSV = DATA_DIR / "kb_chunks.csv"
+INDEX_CACHE_DIR = APP_DIR / ".index_cache"
 
 
 # =========================================================
 # Small helpers
 # =========================================================
-def safe_str(x) -> str:
-    return "" if x is None else str(x)
-
 def parse_pipe_list(value: str):
     if not isinstance(value, str):
         return []
@@ -137,21 +142,57 @@ def detect_intent(text: str) -> str:
 # =========================================================
 # Load data
 # =========================================================
-@st.cache_data(show_spinner=False)
-def load_qa_df(path: Path) -> pd.DataFrame:
-    df = pd.read_csv(path).fillna("")
-    for col in ["id", "category", "question", "answer", "sources", "source_pages", "followups"]:
-        if col not in df.columns:
-            df[col] = ""
-    return df
+# Immutable per-row records, so a hit is a list index + attribute access.
+class QAEntry(NamedTuple):
+    id: str
+    category: str
+    question: str
+    answer: str
+    sources: tuple[str, ...]
+    source_pages: str
+
+class ChunkEntry(NamedTuple):
+    text: str
+    doc_title: str
+    page_start: str
+    page_end: str
+
+def read_csv_rows(path: Path, columns: list[str]) -> list[dict[str, str]]:
+    # stdlib csv keeps pandas off the startup path; every field is a str ("" if empty)
+    with path.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f, restval=""))
+    for row in rows:
+        for col in columns:
+            row.setdefault(col, "")
+    return rows
 
-@st.cache_data(show_spinner=False)
-def load_chunks_df(path: Path) -> pd.DataFrame:
-    df = pd.read_csv(path).fillna("")
-    for col in ["chunk_id", "doc_title", "section", "page_start", "page_end", "text", "source_url"]:
-        if col not in df.columns:
-            df[col] = ""
-    return df
+@st.cache_resource(show_spinner=False)
+def load_qa(path: Path) -> list[QAEntry]:
+    rows = read_csv_rows(path, ["id", "category", "question", "answer", "sources", "source_pages"])
+    return [
+        QAEntry(
+            id=row["id"],
+            category=sys.intern(row["category"]),
+            question=row["question"],
+            answer=row["answer"].strip(),
+            sources=tuple(parse_pipe_list(row["sources"])),
+            source_pages=row["source_pages"],
+        )
+        for row in rows
+    ]
+
+@st.cache_resource(show_spinner=False)
+def load_chunks(path: Path) -> list[ChunkEntry]:
+    rows = read_csv_rows(path, ["doc_title", "page_start", "page_end", "text"])
+    return [
+        ChunkEntry(
+            text=row["text"],
+            doc_title=sys.intern(row["doc_title"].strip()),
+            page_start=row["page_start"].strip(),
+            page_end=row["page_end"].strip(),
+        )
+        for row in rows
+    ]
 
 if not QA_CSV.exists() or not CHUNKS_CSV.exists():
     st.error(
@@ -160,45 +201,232 @@ if not QA_CSV.exists() or not CHUNKS_CSV.exists():
     )
     st.stop()
 
-qa_df = load_qa_df(QA_CSV)
-chunks_df = load_chunks_df(CHUNKS_CSV)
+qa_entries = load_qa(QA_CSV)
+chunk_entries = load_chunks(CHUNKS_CSV)
 
 
 # =========================================================
 # Build vector indexes (fast + cached)
 # =========================================================
+# Bump when the index build changes so cached indexes are rebuilt.
+INDEX_VERSION = 5
+
+# Densify an index when it fits this budget; past it, keep per-term postings
+# (an inverted index) and score only the query's terms.
+DENSE_INDEX_MAX_BYTES = 8 * 1024 * 1024
+
+# Optional cap on index width (TfidfVectorizer's max_features). Left off:
+# on the Q/A set a 2000-term cap drops question -> own-answer top-1 from
+# ~98% to ~78% (unigrams only: ~91%) to save ~35us on the matvec.
+INDEX_MAX_FEATURES = None
+
+# Scores are shown to 3 decimals; float32 halves the bytes moved per matvec.
+INDEX_DTYPE = np.float32
+
+# TfidfVectorizer's default token_pattern, compiled once
+TOKEN_PAT = re.compile(r"(?u)\b\w\w+\b")
+
+def analyze(text: str) -> list[str]:
+    # same terms as TfidfVectorizer(stop_words="english", ngram_range=(1, 2));
+    # TOKEN_PAT already splits on punctuation/whitespace, so no separate cleanup
+    tokens = [t for t in TOKEN_PAT.findall(text.lower()) if t not in ENGLISH_STOP_WORDS]
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+def fit_tfidf(texts: list[str], max_df: float, max_features: int | None = None) -> dict:
+    """
+    Small stand-in for TfidfVectorizer(sublinear_tf=True, max_df=..., max_features=...):
+    - smoothed idf, 1 + log(tf) weights, L2-normalized rows
+    - max_features keeps the most frequent terms across the corpus
+    - the matrix is returned as sparse (rows, cols, data) triples
+    """
+    doc_counts = [Counter(analyze(t)) for t in texts]
+    n_docs = len(doc_counts)
+    df = Counter(term for counts in doc_counts for term in counts)
+    max_count = max_df * n_docs
+    terms = [t for t, c in df.items() if c <= max_count]
+    if max_features is not None and len(terms) > max_features:
+        total = Counter()
+        for counts in doc_counts:
+            total.update(counts)
+        terms = sorted(terms, key=lambda t: (-total[t], t))[:max_features]
+    terms.sort()
+    vocab = {t: j for j, t in enumerate(terms)}
+    idf = np.log((1 + n_docs) / (1 + np.array([df[t] for t in terms], dtype=INDEX_DTYPE))) + 1
+
+    rows, cols, tfs = [], [], []
+    for i, counts in enumerate(doc_counts):
+        for term, c in counts.items():
+            j = vocab.get(term)
+            if j is not None:
+                rows.append(i)
+                cols.append(j)
+                tfs.append(c)
+    rows = np.array(rows, dtype=np.int32)
+    cols = np.array(cols, dtype=np.int32)
+    data = (1 + np.log(np.array(tfs, dtype=INDEX_DTYPE))) * idf[cols]
+    norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=n_docs))
+    data /= norms[rows]
+    return {"vocab": vocab, "idf": idf, "n_docs": n_docs, "rows": rows, "cols": cols, "data": data}
+
+def tfidf_dense(tfidf: dict) -> np.ndarray:
+    mat = np.zeros((tfidf["n_docs"], len(tfidf["vocab"])), dtype=INDEX_DTYPE)
+    mat[tfidf["rows"], tfidf["cols"]] = tfidf["data"]
+    return mat
+
+def tfidf_query(tfidf: dict, text: str):
+    """Unit-length query vector, or None when no term is in the vocabulary."""
+    vocab = tfidf["vocab"]
+    counts = Counter(t for t in analyze(text) if t in vocab)
+    if not counts:
+        return None
+    qv = np.zeros(len(vocab), dtype=INDEX_DTYPE)
+    for term, c in counts.items():
+        qv[vocab[term]] = 1 + np.log(c)
+    qv *= tfidf["idf"]
+    return qv / np.linalg.norm(qv)
+
+def make_index(name: str, tfidf: dict) -> dict:
+    n_terms = len(tfidf["vocab"])
+    index = {
+        "name": name,
+        "vocab": tfidf["vocab"],
+        "idf": tfidf["idf"],
+        "n_docs": tfidf["n_docs"],
+        "dense": None,
+        "postings": None,
+    }
+    if tfidf["n_docs"] * n_terms * np.dtype(INDEX_DTYPE).itemsize <= DENSE_INDEX_MAX_BYTES:
+        index["dense"] = tfidf_dense(tfidf)
+    else:
+        order = np.argsort(tfidf["cols"], kind="stable")
+        col_ptr = np.concatenate(([0], np.cumsum(np.bincount(tfidf["cols"], minlength=n_terms))))
+        index["postings"] = (col_ptr, tfidf["rows"][order], tfidf["data"][order])
+    return index
+
+def score_docs(index: dict, qv: np.ndarray) -> np.ndarray:
+    # rows are unit length, so cosine similarity is a plain dot product
+    if index["dense"] is not None:
+        return index["dense"] @ qv
+    col_ptr, post_rows, post_data = index["postings"]
+    sims = np.zeros(index["n_docs"], dtype=INDEX_DTYPE)
+    for j in np.flatnonzero(qv):
+        lo, hi = col_ptr[j], col_ptr[j + 1]
+        sims[post_rows[lo:hi]] += post_data[lo:hi] * qv[j]
+    return sims
+
+# Below this many rows the jit dispatch costs more than numpy's matvec + sort.
+NUMBA_MIN_DOCS = 256
+
+def uses_topk_kernel(index: dict) -> bool:
+    return topk_kernel.AVAILABLE and index["dense"] is not None and index["n_docs"] >= NUMBA_MIN_DOCS
+
+def topk_cosine(index: dict, qv: np.ndarray, k: int):
+    """Top-k (doc indices, scores), best first."""
+    if uses_topk_kernel(index):
+        return topk_kernel.topk_cosine(index["dense"], qv, k)
+    # NaN -> 0 so a degenerate row can't win the partition; ranks stay branch-free
+    sims = np.nan_to_num(score_docs(index, qv), copy=False)
+    # O(N) partition for the top k, then sort only those k
+    order = np.argpartition(-sims, k - 1)[:k]
+    order = order[np.argsort(-sims[order])]
+    return order, sims[order]
+
+def load_or_build_index(name: str, path: Path, texts: list[str]) -> dict:
+    """
+    Persist built indexes under INDEX_CACHE_DIR so a fresh process skips the fit:
+    - the file name hashes the CSV bytes, the stop words and the index settings;
+      bump INDEX_VERSION when analyze() / fit_tfidf() change
+    - arrays are memory-mapped on load, so worker processes share the pages
+    """
+    settings = repr((
+        INDEX_VERSION,
+        INDEX_MAX_FEATURES,
+        DENSE_INDEX_MAX_BYTES,
+        np.dtype(INDEX_DTYPE).str,
+        sorted(ENGLISH_STOP_WORDS),
+    ))
+    key = hashlib.sha1(path.read_bytes() + settings.encode()).hexdigest()[:12]
+    cache_file = INDEX_CACHE_DIR / f"{name}_{key}.joblib"
+    if cache_file.exists():
+        try:
+            return joblib.load(cache_file, mmap_mode="r")
+        except Exception:
+            pass  # unreadable/stale file: rebuild and overwrite it
+
+    index = make_index(name, fit_tfidf(texts, max_df=0.95, max_features=INDEX_MAX_FEATURES))
+    tmp_file = None
+    try:
+        INDEX_CACHE_DIR.mkdir(exist_ok=True)
+        for old in INDEX_CACHE_DIR.glob(f"{name}_*.joblib"):
+            if old != cache_file:
+                old.unlink(missing_ok=True)
+        # one temp file per writer, so concurrent cold starts never share an inode
+        fd, tmp_name = tempfile.mkstemp(dir=INDEX_CACHE_DIR, prefix=f"{name}_", suffix=".tmp")
+        os.close(fd)
+        tmp_file = Path(tmp_name)
+        joblib.dump(index, tmp_file)
+        tmp_file.replace(cache_file)
+        tmp_file = None
+    except OSError:
+        pass  # read-only deploy: keep the in-memory index only
+    finally:
+        if tmp_file is not None:
+            tmp_file.unlink(missing_ok=True)
+    return index
+
+# The entry args are prefixed with "_" so Streamlit skips hashing them on
+# every rerun; the CSV path + INDEX_VERSION are the cache key instead. Pass the
+# version explicitly: Streamlit only hashes arguments that are actually passed.
 @st.cache_resource(show_spinner=False)
-def build_index_for_qa(df: pd.DataFrame):
-    texts = (df["category"].astype(str) + " " + df["question"].astype(str) + " " + df["answer"].astype(str)).tolist()
-    vec = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), sublinear_tf=True, max_df=0.95)
-    mat = vec.fit_transform(texts)
-    return vec, mat
+def build_index_for_qa(_entries: list[QAEntry], path: Path, version: int):
+    texts = [f"{e.category} {e.question} {e.answer}" for e in _entries]
+    return load_or_build_index("qa", path, texts)
+
+@st.cache_resource(show_spinner=False)
+def build_index_for_chunks(_entries: list[ChunkEntry], path: Path, version: int):
+    texts = [f"{e.doc_title} {e.text}" for e in _entries]
+    return load_or_build_index("chunks", path, texts)
+
+qa_index = build_index_for_qa(qa_entries, QA_CSV, INDEX_VERSION)
+chunk_index = build_index_for_chunks(chunk_entries, CHUNKS_CSV, INDEX_VERSION)
 
+# jit-compile once per process at startup, not inside the first user query
 @st.cache_resource(show_spinner=False)
-def build_index_for_chunks(df: pd.DataFrame):
-    texts = (df["doc_title"].astype(str) + " " + df["text"].astype(str)).tolist()
-    vec = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), sublinear_tf=True, max_df=0.95)
-    mat = vec.fit_transform(texts)
-    return vec, mat
-
-qa_vec, qa_mat = build_index_for_qa(qa_df)
-chunk_vec, chunk_mat = build_index_for_chunks(chunks_df)
-
-def retrieve(vec, mat, query: str, top_k: int):
-    query = normalize(query)
-    if not query:
+def warm_topk_kernel(_index: dict, name: str, version: int) -> bool:
+    if not uses_topk_kernel(_index):
+        return False
+    topk_kernel.warm_up(_index["dense"])
+    return True
+
+warm_topk_kernel(qa_index, "qa", INDEX_VERSION)
+warm_topk_kernel(chunk_index, "chunks", INDEX_VERSION)
+
+# LRU-bounded cache of hit lists, so repeat queries (same chat prompt, the
+# debug panel on every rerun) skip the transform + similarity + sort.
+@st.cache_data(show_spinner=False, max_entries=512)
+def _cached_hits(_index: dict, name: str, version: int, query_key: str, top_k: int):
+    qv = tfidf_query(_index, query_key)
+    if qv is None:
         return []
-    qv = vec.transform([query])
-    sims = cosine_similarity(qv, mat)[0]
-    order = np.argsort(-sims)
-    hits = [(int(i), float(sims[int(i)])) for i in order[:top_k]]
-    return hits
+    k = min(top_k, _index["n_docs"])
+    if k <= 0:
+        return []
+    order, scores = topk_cosine(_index, qv, k)
+    keep = scores > 0
+    return list(zip(order[keep].tolist(), scores[keep].tolist()))
+
+def retrieve(index: dict, query: str, top_k: int):
+    # analyze() lowercases anyway, so case-folding the key is lossless
+    query_key = normalize(query).lower()
+    if not query_key:
+        return []
+    return _cached_hits(index, index["name"], INDEX_VERSION, query_key, top_k)
 
 
 # =========================================================
 # Answer formatting
 # =========================================================
-def render_sources_block(sources: list[str], pages: str = "") -> str:
+def render_sources_block(sources: tuple[str, ...], pages: str = "") -> str:
     if not sources and not pages:
         return ""
     out = "**Sources**\n"
@@ -211,11 +439,29 @@ def render_sources_block(sources: list[str], pages: str = "") -> str:
         out += f"\n<span class='small'>Pages: {pages.strip()}</span>"
     return out
 
-def qa_answer(row: pd.Series) -> tuple[str, str]:
-    answer = safe_str(row["answer"]).strip()
-    sources = parse_pipe_list(safe_str(row.get("sources", "")))
-    pages = safe_str(row.get("source_pages", ""))
-    return answer, render_sources_block(sources, pages)
+def prerender_markdown(text: str) -> str:
+    # one paragraph per source line, like the "\n\n"-joined doc answers; a bare
+    # "\n" is a soft break in Markdown and runs the steps together
+    lines = (line.strip() for line in text.replace("\r\n", "\n").split("\n"))
+    return "\n\n".join(line for line in lines if line)
+
+def qa_answer(entry: QAEntry) -> str:
+    final = prerender_markdown(entry.answer)
+    sources_block = render_sources_block(entry.sources, entry.source_pages)
+    if sources_block:
+        final += "\n\n" + sources_block
+    return final
+
+# Q/A answers are static, so render them once instead of on every hit. Bump
+# RENDER_VERSION when prerender_markdown / qa_answer / render_sources_block
+# change: only the arguments passed here are part of the cache key.
+RENDER_VERSION = 1
+
+@st.cache_resource(show_spinner=False)
+def prerender_qa_answers(_entries: list[QAEntry], path: Path, version: int) -> list[str]:
+    return [qa_answer(e) for e in _entries]
+
+qa_answers_md = prerender_qa_answers(qa_entries, QA_CSV, RENDER_VERSION)
 
 def doc_summarize_answer(query: str, chunk_hits: list[tuple[int, float]], max_chunks: int = 5) -> tuple[str, str]:
     """
@@ -235,13 +481,13 @@ def doc_summarize_answer(query: str, chunk_hits: list[tuple[int, float]], max_ch
     cite_lines = []
 
     for rank, idx in enumerate(picked, start=1):
-        row = chunks_df.iloc[idx]
-        txt = safe_str(row["text"])
+        chunk = chunk_entries[idx]
+        txt = chunk.text
         texts.append(txt)
 
-        doc = safe_str(row["doc_title"]).strip()
-        p1 = safe_str(row.get("page_start", "")).strip()
-        p2 = safe_str(row.get("page_end", "")).strip()
+        doc = chunk.doc_title
+        p1 = chunk.page_start
+        p2 = chunk.page_end
         if p1 and p2 and p1 != p2:
             cite_lines.append(f"[{rank}] {doc} (pp. {p1}-{p2})")
         elif p1:
@@ -262,23 +508,20 @@ def doc_summarize_answer(query: str, chunk_hits: list[tuple[int, float]], max_ch
             "**Sources (internal)**\n" + "\n".join([f"- {c}" for c in cite_lines])
         )
 
-    local_vec = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), sublinear_tf=True, max_df=0.98)
-    smat = local_vec.fit_transform(sentences + [query])
-    qv = smat[-1]
-    sent_mat = smat[:-1]
-    sims = cosine_similarity(qv, sent_mat)[0]
-    order = np.argsort(-sims)
+    smat = tfidf_dense(fit_tfidf(sentences + [query], max_df=0.98))
+    sims = np.nan_to_num(smat[:-1] @ smat[-1], copy=False)
+    # threshold once with a mask, then only sort the sentences that pass
+    order = np.flatnonzero(sims >= 0.05)
+    order = order[np.argsort(-sims[order])]
 
     # Pick best distinct sentences
     chosen = []
     used = set()
-    for i in order:
-        s = sentences[int(i)]
+    for i in order.tolist():
+        s = sentences[i]
         key = s[:60]
         if key in used:
             continue
-        if sims[int(i)] < 0.05:
-            break
         chosen.append(s)
         used.add(key)
         if len(chosen) >= 6:
@@ -302,8 +545,8 @@ def doc_summarize_answer(query: str, chunk_hits: list[tuple[int, float]], max_ch
 # Suggestions (prompt chips)
 # =========================================================
 @st.cache_data(show_spinner=False)
-def get_recommended_prompts(df: pd.DataFrame, n=8):
-    qs = [q for q in df["question"].astype(str).tolist() if q.strip()]
+def get_recommended_prompts(questions: list[str], n=8):
+    qs = [q for q in questions if q.strip()]
     # pick short, high-coverage prompts
     qs = sorted(qs, key=lambda x: len(x))[: max(n * 3, 10)]
     priority = [
@@ -323,7 +566,7 @@ def get_recommended_prompts(df: pd.DataFrame, n=8):
             break
     return out
 
-RECOMMENDED = get_recommended_prompts(qa_df, n=8)
+RECOMMENDED = get_recommended_prompts([e.question for e in qa_entries], n=8)
 
 def render_prompt_chips(prompts: list[str]):
     if not prompts:
@@ -358,9 +601,13 @@ with right:
         unsafe_allow_html=True,
     )
 
+# Q/A hits are always fetched at the slider max and sliced to qa_top_k, so
+# moving the slider never re-runs retrieval.
+QA_TOP_K_MAX = 8
+
 with st.sidebar:
     st.markdown("### Retrieval Settings")
-    qa_top_k = st.slider("Q/A top_k", 1, 8, 4)
+    qa_top_k = st.slider("Q/A top_k", 1, QA_TOP_K_MAX, 4)
     docs_top_k = st.slider("Docs top_k", 1, 10, 5)
     use_docs_fallback = st.toggle("Use docs fallback (RAG)", value=True)
     show_debug = st.toggle("Show debug (scores)", value=False)
@@ -378,6 +625,7 @@ with st.sidebar:
         st.session_state.messages = []
         st.session_state.pending_prompt = None
         st.session_state.context = ""
+        st.session_state.last_qa = None
         st.rerun()
 
 
@@ -393,6 +641,10 @@ if "pending_prompt" not in st.session_state:
 if "context" not in st.session_state:
     st.session_state.context = ""
 
+# {"query": ..., "hits": ...} for the last Q/A retrieval (QA_TOP_K_MAX hits)
+if "last_qa" not in st.session_state:
+    st.session_state.last_qa = None
+
 
 # =========================================================
 # Input collection (typed OR clicked)
@@ -432,26 +684,20 @@ if prompt:
         st.session_state.messages.append({"role": "assistant", "content": msg})
     else:
         # 1) Q/A retrieval (best for accuracy)
-        qa_hits = retrieve(qa_vec, qa_mat, prompt, qa_top_k)
-        best_idx, best_score = qa_hits[0]
+        qa_hits = retrieve(qa_index, prompt, QA_TOP_K_MAX)
+        st.session_state.last_qa = {"query": prompt, "hits": qa_hits}
+        best_idx, best_score = qa_hits[0] if qa_hits else (None, 0.0)
 
         # Tuned thresholds: prefer QA when we have a reasonable match
         QA_USE_THRESHOLD = 0.16
 
         if best_score >= QA_USE_THRESHOLD:
-            row = qa_df.iloc[best_idx]
-            answer, sources_block = qa_answer(row)
-
-            final = answer
-            if sources_block:
-                final += "\n\n" + sources_block
-
-            st.session_state.messages.append({"role": "assistant", "content": final})
+            st.session_state.messages.append({"role": "assistant", "content": qa_answers_md[best_idx]})
 
         else:
             # 2) Docs fallback (better summarization, not random chunk dumping)
             if use_docs_fallback:
-                doc_hits = retrieve(chunk_vec, chunk_mat, prompt, docs_top_k)
+                doc_hits = retrieve(chunk_index, prompt, docs_top_k)
                 answer, cites = doc_summarize_answer(prompt, doc_hits, max_chunks=min(6, docs_top_k))
 
                 final = answer
@@ -497,13 +743,17 @@ if show_debug and st.session_state.messages:
     # show last QA retrieval info if last user message exists
     last_user = next((m["content"] for m in reversed(st.session_state.messages) if m["role"] == "user"), "")
     if last_user:
-        qa_hits = retrieve(qa_vec, qa_mat, last_user, qa_top_k)
-        dbg = []
-        for r, (idx, score) in enumerate(qa_hits, start=1):
-            dbg.append({
-                "Rank": r,
-                "Score": round(score, 3),
-                "Question": safe_str(qa_df.iloc[idx]["question"]),
-            })
+        last_qa = st.session_state.last_qa
+        if last_qa is None or last_qa["query"] != last_user:
+            last_qa = {"query": last_user, "hits": retrieve(qa_index, last_user, QA_TOP_K_MAX)}
+            st.session_state.last_qa = last_qa
+        qa_hits = last_qa["hits"][:qa_top_k]
+        dbg = {
+            "Rank": list(range(1, len(qa_hits) + 1)),
+            "Score": [round(score, 3) for _, score in qa_hits],
+            "Question": [qa_entries[idx].question for idx, _ in qa_hits],
+        }
+        import pandas as pd  # only needed for this table
+
         st.markdown("**Debug (Top Q/A matches)**")
         st.dataframe(pd.DataFrame(dbg), width="stretch", hide_index=True)
\ No newline at end of file
@@ -0,0 +1,55 @@
+# Optional numba fused dot + top-k for large dense TF-IDF indexes.
+# Kept out of app.py so the jitted dispatcher is created once per process
+# (Streamlit re-executes the app script on every rerun).
+import numpy as np
+
+try:
+    from numba import config, get_num_threads, njit, prange
+except ImportError:
+    njit = None
+else:
+    # Streamlit runs the script (and so the first parallel launch) off the main
+    # thread; the TBB layer hung there in testing, so prefer OpenMP.
+    config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+
+AVAILABLE = njit is not None
+
+if AVAILABLE:
+    @njit(parallel=True, fastmath=True)
+    def _topk_cosine(docs, q_idx, q_val, k, n_blocks):
+        # fused dot + top-k: each block keeps a small sorted top-k over its
+        # rows (scores are >= 0, so -1 marks an empty slot), then merge
+        n = docs.shape[0]
+        step = (n + n_blocks - 1) // n_blocks
+        best_s = np.full((n_blocks, k), -1.0, dtype=np.float32)
+        best_i = np.full((n_blocks, k), -1, dtype=np.int64)
+        for b in prange(n_blocks):
+            for r in range(b * step, min(n, (b + 1) * step)):
+                acc = np.float32(0.0)
+                for j in range(q_idx.size):
+                    acc += docs[r, q_idx[j]] * q_val[j]
+                if acc > best_s[b, k - 1]:
+                    pos = k - 1
+                    while pos > 0 and best_s[b, pos - 1] < acc:
+                        best_s[b, pos] = best_s[b, pos - 1]
+                        best_i[b, pos] = best_i[b, pos - 1]
+                        pos -= 1
+                    best_s[b, pos] = acc
+                    best_i[b, pos] = r
+        flat_s = best_s.ravel()
+        order = np.argsort(-flat_s)[:k]
+        return best_i.ravel()[order], flat_s[order]
+
+
+def topk_cosine(docs: np.ndarray, qv: np.ndarray, k: int):
+    """Top-k (row indices, scores) of docs @ qv, best first. Needs AVAILABLE."""
+    q_idx = np.flatnonzero(qv)
+    n_blocks = max(1, min(get_num_threads(), docs.shape[0] // k))
+    return _topk_cosine(docs, q_idx, qv[q_idx], k, n_blocks)
+
+
+def warm_up(docs: np.ndarray) -> None:
+    """Compile for this exact array type (dtype, layout, read-only memmap or not)."""
+    qv = np.zeros(docs.shape[1], dtype=docs.dtype)
+    qv[:1] = 1
+    topk_cosine(docs, qv, 1)